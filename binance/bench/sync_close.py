@@ -0,0 +1,65 @@
+"""Stress check: `binance.sync.Binance.close()` while other threads are making calls.
+
+Every caller must return (no thread left blocked), and calls cut off by the close must fail
+with `UserError`, like calls made after it.
+
+Usage: `python bench/sync_close.py [--trials 30] [--threads 8]`
+"""
+import argparse
+import os
+import threading
+import time
+
+from binance.core import UserError
+from binance.sync import Binance
+from sync_facade import serve
+
+def trial(base_url: str, threads: int, close_after: float) -> tuple[int, set[str]]:
+  """Returns the number of threads still blocked, and the exception types seen by callers."""
+  client = Binance.new(base_url=base_url)
+  errors: set[str] = set()
+
+  def call():
+    while True:
+      try:
+        client.wallet.capital.coins()
+      except UserError:
+        return
+      except Exception as e:
+        errors.add(type(e).__name__)
+        return
+
+  workers = [threading.Thread(target=call, daemon=True) for _ in range(threads)]
+  for w in workers:
+    w.start()
+  time.sleep(close_after)
+  client.close()
+  for w in workers:
+    w.join(timeout=3)
+  return sum(w.is_alive() for w in workers), errors
+
+def main():
+  parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+  parser.add_argument('--trials', type=int, default=30)
+  parser.add_argument('--threads', type=int, default=8)
+  args = parser.parse_args()
+
+  server, base_url = serve()
+  os.environ.setdefault('BINANCE_API_KEY', 'bench')
+  os.environ.setdefault('BINANCE_API_SECRET', 'bench')
+  failed = 0
+  try:
+    for i in range(args.trials):
+      stuck, errors = trial(base_url, args.threads, close_after=0.12)
+      if stuck or errors:
+        failed += 1
+        print(f'trial {i}: {stuck} threads blocked, unexpected errors: {sorted(errors)}')
+  finally:
+    server.shutdown()
+    server.server_close()
+  print(f'{args.trials - failed}/{args.trials} trials OK')
+  if failed:
+    raise SystemExit(1)
+
+if __name__ == '__main__':
+  main()
@@ -0,0 +1,85 @@
+"""Benchmark: `binance.sync.Binance` vs. `asyncio.run` per call.
+
+Serves a canned `/sapi/v1/capital/config/getall` response from a local keep-alive HTTP server
+(or hits `--base-url`, which needs `BINANCE_API_KEY`/`BINANCE_API_SECRET`), then times N sequential calls:
+
+- `asyncio.run`: a fresh event loop and `httpx.AsyncClient` (hence a new connection) per call
+- `sync facade`: one background loop with a warm connection pool
+
+Usage: `python bench/sync_facade.py [-n 200] [--base-url URL]`
+"""
+import argparse
+import asyncio
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import binance
+from binance.sync import Binance
+
+BODY = b'[]'
+
+class Handler(BaseHTTPRequestHandler):
+  protocol_version = 'HTTP/1.1' # keep-alive
+  disable_nagle_algorithm = True
+
+  def do_GET(self):
+    self.send_response(200)
+    self.send_header('Content-Type', 'application/json')
+    self.send_header('Content-Length', str(len(BODY)))
+    self.end_headers()
+    self.wfile.write(BODY)
+
+  def log_message(self, format, *args):
+    ...
+
+def serve() -> tuple[ThreadingHTTPServer, str]:
+  server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+  threading.Thread(target=server.serve_forever, daemon=True).start()
+  host, port = server.server_address[:2]
+  return server, f'http://{host}:{port}'
+
+def bench_asyncio_run(n: int, base_url: str) -> float:
+  async def call():
+    async with binance.Binance.new(base_url=base_url) as client:
+      await client.wallet.capital.coins()
+
+  start = time.perf_counter()
+  for _ in range(n):
+    asyncio.run(call())
+  return time.perf_counter() - start
+
+def bench_sync(n: int, base_url: str) -> float:
+  with Binance.new(base_url=base_url) as client:
+    client.wallet.capital.coins() # warm up the connection, as a long-lived worker would
+    start = time.perf_counter()
+    for _ in range(n):
+      client.wallet.capital.coins()
+    return time.perf_counter() - start
+
+def main():
+  parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+  parser.add_argument('-n', type=int, default=200, help='Number of calls per variant')
+  parser.add_argument('--base-url', help='Benchmark against this URL instead of a local server')
+  args = parser.parse_args()
+
+  server = None
+  if args.base_url is None:
+    server, base_url = serve()
+    os.environ.setdefault('BINANCE_API_KEY', 'bench')
+    os.environ.setdefault('BINANCE_API_SECRET', 'bench')
+  else:
+    base_url = args.base_url
+
+  try:
+    for name, bench in [('asyncio.run', bench_asyncio_run), ('sync facade', bench_sync)]:
+      t = bench(args.n, base_url)
+      print(f'{name:>12}: {t:.3f}s total, {1e3*t/args.n:.3f}ms/call')
+  finally:
+    if server is not None:
+      server.shutdown()
+      server.server_close()
+
+if __name__ == '__main__':
+  main()
@@ -1,12 +1,14 @@
 from .util import timestamp, round2tick, trunc2tick
-from .exc import Error, NetworkError, UserError, ValidationError, AuthError, ApiError
+from .exc import Error, NetworkError, UserError, ValidationError, AuthError, ApiError, DeadlineExceeded
+from .timeouts import deadline, remaining, expires
 from .validation import ValidationMixin, validator, TypedDict, Timestamp
 from .http import HttpClient, HttpMixin, AuthHttpClient, AuthHttpMixin
 from .mixin import Endpoint, AuthEndpoint, Router, AuthRouter, validator, BINANCE_REST_URL
 
 __all__ = [
   'timestamp', 'round2tick', 'trunc2tick',
-  'Error', 'NetworkError', 'UserError', 'ValidationError', 'AuthError', 'ApiError',
+  'Error', 'NetworkError', 'UserError', 'ValidationError', 'AuthError', 'ApiError', 'DeadlineExceeded',
+  'deadline', 'remaining', 'expires',
   'ValidationMixin', 'validator', 'TypedDict', 'Timestamp',
   'HttpClient', 'HttpMixin', 'AuthHttpClient', 'AuthHttpMixin',
   'Endpoint', 'AuthEndpoint', 'Router', 'AuthRouter', 'validator',
@@ -21,4 +21,8 @@ class AuthError(Error):
 
 class ApiError(Error):
   def __str__(self):
-    return super().__str__()
\ No newline at end of file
+    return super().__str__()
+
+class DeadlineExceeded(NetworkError):
+  def __str__(self):
+    return super().__str__()
@@ -3,7 +3,22 @@ from dataclasses import dataclass, field
 import asyncio
 import httpx
 
-from ..exc import NetworkError
+from ..exc import NetworkError, DeadlineExceeded
+from ..timeouts import remaining
+
+TIMEOUT_PHASES: dict[type[httpx.TimeoutException], str] = {
+  httpx.ConnectTimeout: 'connect',
+  httpx.ReadTimeout: 'read',
+  httpx.WriteTimeout: 'write',
+  httpx.PoolTimeout: 'pool',
+}
+
+def _cap_timeout(timeout: httpx._types.TimeoutTypes, budget: float) -> tuple[httpx.Timeout, set[str]]:
+  """Cap every phase of `timeout` at `budget`. Also returns the phases the budget is what limits."""
+  t = httpx.Timeout(timeout)
+  phases = {'connect': t.connect, 'read': t.read, 'write': t.write, 'pool': t.pool}
+  bounded = {k for k, v in phases.items() if v is None or budget < v}
+  return httpx.Timeout(**{k: budget if v is None else min(v, budget) for k, v in phases.items()}), bounded
 
 @dataclass
 class HttpClient:
@@ -46,16 +61,30 @@ class HttpClient:
     timeout: httpx._types.TimeoutTypes | httpx._client.UseClientDefault = httpx.USE_CLIENT_DEFAULT,
     extensions: httpx._types.RequestExtensions | None = None,
   ):
+    req = f'{method} {url}'
+    budget = remaining()
+    bounded: set[str] = set() # timeout phases limited by the budget
+    if budget is not None and budget <= 0:
+      raise DeadlineExceeded(f'Deadline exceeded before sending request to {req}')
+
     try:
       client = await self.client
-      return await client.request(
+      if budget is not None:
+        # shrink the per-request timeout to what's left of the budget
+        if isinstance(timeout, httpx._client.UseClientDefault):
+          timeout = client.timeout
+        timeout, bounded = _cap_timeout(timeout, budget)
+      return await asyncio.wait_for(client.request(
         method, url, params=params, cookies=cookies, json=json,
         content=content, data=data, files=files, auth=auth, follow_redirects=follow_redirects,
         timeout=timeout, extensions=extensions,
         headers=headers,
-      )
+      ), budget)
+    except asyncio.TimeoutError as e:
+      raise DeadlineExceeded(f'Deadline exceeded sending request to {req}') from e
     except httpx.HTTPError as e:
-      req = f'{method} {url}'
+      if isinstance(e, httpx.TimeoutException) and TIMEOUT_PHASES.get(type(e)) in bounded:
+        raise DeadlineExceeded(f'Deadline exceeded sending request to {req}') from e
       raise NetworkError(f'Error sending request to {req}', *e.args) from e
 
 @dataclass
@@ -1,5 +1,6 @@
 from typing_extensions import TypeVar, TypedDict
 import os
+import math
 from dataclasses import dataclass, field
 import orjson
 from pydantic import TypeAdapter, ValidationError
@@ -7,6 +8,7 @@ from pydantic import TypeAdapter, ValidationError
 from .http import HttpMixin, AuthHttpMixin, AuthHttpClient
 from .validation import ValidationMixin, validator
 from .exc import ApiError
+from .timeouts import deadline
 
 T = TypeVar('T')
 
@@ -29,6 +31,17 @@ def is_err(response):
 @dataclass
 class BaseMixin(ValidationMixin):
   base_url: str = field(kw_only=True, default=BINANCE_REST_URL)
+  default_timeout: float | None = field(default=None, kw_only=True)
+
+  def _resolve_timeout(self, timeout: float | None) -> float | None:
+    """`None` means `default_timeout`; `math.inf` means no timeout (even if there's a default)."""
+    if timeout is None:
+      return self.default_timeout
+    return None if math.isinf(timeout) else timeout
+
+  def _deadline_scope(self, timeout: float | None = None):
+    """Deadline scope for a call: the given `timeout` (seconds), or the default one. Nested inside any outer scope."""
+    return deadline(self._resolve_timeout(timeout))
 
   def output(self, data: str | bytes, validator: validator[T], validate: bool | None) -> T:
     if is_err(data):
@@ -46,21 +59,24 @@ class AuthEndpoint(Endpoint, AuthHttpMixin):
   @classmethod
   def new(
     cls, api_key: str | None = None, api_secret: str | None = None, *,
-    base_url: str = BINANCE_REST_URL, validate: bool = True,
+    base_url: str = BINANCE_REST_URL, validate: bool = True, timeout: float | None = None,
   ):
     if api_key is None:
       api_key = os.environ['BINANCE_API_KEY']
     if api_secret is None:
       api_secret = os.environ['BINANCE_API_SECRET']
     client = AuthHttpClient(api_key=api_key, api_secret=api_secret)
-    return cls(base_url=base_url, http=client, default_validate=validate)
+    return cls(base_url=base_url, http=client, default_validate=validate, default_timeout=timeout)
 
 @dataclass
 class Router(Endpoint):
   def __post_init__(self):
     for field, cls in self.__annotations__.items():
       if issubclass(cls, Endpoint) or issubclass(cls, Router):
-        setattr(self, field, cls(base_url=self.base_url, http=self.http, default_validate=self.default_validate))
+        setattr(self, field, cls(
+          base_url=self.base_url, http=self.http,
+          default_validate=self.default_validate, default_timeout=self.default_timeout,
+        ))
 
 @dataclass
 class AuthRouter(Router, AuthEndpoint):
@@ -0,0 +1,36 @@
+from contextvars import ContextVar
+from contextlib import contextmanager
+import time
+
+current_deadline: ContextVar[float | None] = ContextVar('binance_deadline', default=None)
+"""Absolute deadline (`time.monotonic()` seconds) of the current scope, if any"""
+
+def expires(timeout: float | None) -> float | None:
+  """Absolute deadline for a `timeout` (seconds) starting now"""
+  return None if timeout is None else time.monotonic() + timeout
+
+def remaining() -> float | None:
+  """Seconds left in the current deadline scope (`None` if unbounded; may be negative if expired)"""
+  at = current_deadline.get()
+  return None if at is None else at - time.monotonic()
+
+@contextmanager
+def deadline(timeout: float | None = None, *, at: float | None = None):
+  """Run the block under a time budget: every request sent inside it gets its timeout shrunk to what's left, and fails with `DeadlineExceeded` once it runs out.
+
+  - `timeout`: Budget in seconds, starting now
+  - `at`: Absolute deadline (`time.monotonic()` seconds), instead of `timeout`
+
+  Nested scopes can only shrink the budget, never extend it.
+  """
+  if at is None:
+    at = expires(timeout)
+  outer = current_deadline.get()
+  if at is None or (outer is not None and outer <= at):
+    yield outer
+    return
+  token = current_deadline.set(at)
+  try:
+    yield at
+  finally:
+    current_deadline.reset(token)
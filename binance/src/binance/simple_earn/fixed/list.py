@@ -3,7 +3,7 @@ from typing_extensions import NotRequired, AsyncIterable
 from dataclasses import dataclass
 from decimal import Decimal
 
-from binance.core import AuthEndpoint, validator, TypedDict
+from binance.core import AuthEndpoint, validator, TypedDict, DeadlineExceeded, deadline, expires
 
 class LockedProductDetail(TypedDict):
   asset: str
@@ -65,6 +65,7 @@ class LockedList(AuthEndpoint):
     current: int | None = None,
     size: int | None = None,
     recv_window: int | None = None,
+    timeout: float | None = None,
     validate: bool | None = None
   ):
     """Get available Simple Earn locked product list.
@@ -73,6 +74,7 @@ class LockedList(AuthEndpoint):
     - `current`: Currently querying page. Start from 1. Default: 1
     - `size`: Page size. Default: 10, Max: 100
     - `recv_window`: Request receive window (milliseconds)
+    - `timeout`: Time budget for the call (seconds); defaults to the endpoint's `default_timeout` (pass `math.inf` to disable it).
     - `validate`: Whether to validate the response against the expected schema (default: True).
 
     > [Binance API docs](https://developers.binance.com/docs/simple_earn/flexible-locked/account/Get-Simple-Earn-Locked-Product-List)
@@ -86,7 +88,8 @@ class LockedList(AuthEndpoint):
       params['size'] = size
     if recv_window is not None:
       params['recvWindow'] = recv_window
-    r = await self.authed_request('GET', '/sapi/v1/simple-earn/locked/list', params=params)
+    with self._deadline_scope(timeout):
+      r = await self.authed_request('GET', '/sapi/v1/simple-earn/locked/list', params=params)
     return self.output(r.text, validate_response, validate=validate)
 
 
@@ -96,13 +99,26 @@ class LockedList(AuthEndpoint):
     asset: str | None = None,
     size: int = 100,
     recv_window: int | None = None,
+    timeout: float | None = None,
+    partial: bool = False,
     validate: bool | None = None
   ) -> AsyncIterable[builtins.list[LockedProductRow]]:
     """Get available Simple Earn locked product list.
+
+    - `timeout`: Time budget for the whole iteration (seconds); defaults to the endpoint's `default_timeout` (pass `math.inf` to disable it).
+    - `partial`: If the budget runs out, stop iterating instead of raising `DeadlineExceeded`. The listing may then be incomplete, and looks
+      the same as a complete one; to tell them apart, leave `partial=False` and catch `DeadlineExceeded` (the pages already yielded are kept).
     """
+    at = expires(self._resolve_timeout(timeout))
     current = 1
     while True:
-      r = await self.list(asset=asset, current=current, size=size, recv_window=recv_window, validate=validate)
+      try:
+        with deadline(at=at):
+          r = await self.list(asset=asset, current=current, size=size, recv_window=recv_window, timeout=timeout, validate=validate)
+      except DeadlineExceeded:
+        if partial:
+          break
+        raise
       if not r['rows']:
         break
       yield r['rows']
@@ -3,7 +3,7 @@ from typing_extensions import Literal, NotRequired, AsyncIterable
 from dataclasses import dataclass
 from decimal import Decimal
 
-from binance.core import AuthEndpoint, validator, TypedDict
+from binance.core import AuthEndpoint, validator, TypedDict, DeadlineExceeded, deadline, expires
 
 class FlexibleProductRow(TypedDict):
   asset: str
@@ -48,6 +48,7 @@ class FlexibleList(AuthEndpoint):
     current: int | None = None,
     size: int | None = None,
     recv_window: int | None = None,
+    timeout: float | None = None,
     validate: bool | None = None
   ):
     """Get available Simple Earn flexible product list.
@@ -56,6 +57,7 @@ class FlexibleList(AuthEndpoint):
     - `current`: Currently querying page. Start from 1. Default: 1
     - `size`: Page size. Default: 10, Max: 100
     - `recv_window`: Request receive window (milliseconds)
+    - `timeout`: Time budget for the call (seconds); defaults to the endpoint's `default_timeout` (pass `math.inf` to disable it).
     - `validate`: Whether to validate the response against the expected schema (default: True).
 
     > [Binance API docs](https://developers.binance.com/docs/simple_earn/flexible-locked/account/Get-Simple-Earn-Flexible-Product-List)
@@ -69,7 +71,8 @@ class FlexibleList(AuthEndpoint):
       params['size'] = size
     if recv_window is not None:
       params['recvWindow'] = recv_window
-    r = await self.authed_request('GET', '/sapi/v1/simple-earn/flexible/list', params=params)
+    with self._deadline_scope(timeout):
+      r = await self.authed_request('GET', '/sapi/v1/simple-earn/flexible/list', params=params)
     return self.output(r.text, validate_response, validate=validate)
 
 
@@ -79,6 +82,8 @@ class FlexibleList(AuthEndpoint):
     asset: str | None = None,
     size: int = 100,
     recv_window: int | None = None,
+    timeout: float | None = None,
+    partial: bool = False,
     validate: bool | None = None
   ) -> AsyncIterable[builtins.list[FlexibleProductRow]]:
     """Get available Simple Earn flexible product list.
@@ -86,13 +91,23 @@ class FlexibleList(AuthEndpoint):
     - `asset`: Filter by asset
     - `size`: Page size. Default: 100, Max: 100
     - `recv_window`: Request receive window (milliseconds)
+    - `timeout`: Time budget for the whole iteration (seconds); defaults to the endpoint's `default_timeout` (pass `math.inf` to disable it).
+    - `partial`: If the budget runs out, stop iterating instead of raising `DeadlineExceeded`. The listing may then be incomplete, and looks
+      the same as a complete one; to tell them apart, leave `partial=False` and catch `DeadlineExceeded` (the pages already yielded are kept).
     - `validate`: Whether to validate the response against the expected schema (default: True).
 
     > [Binance API docs](https://developers.binance.com/docs/simple_earn/flexible-locked/account/Get-Simple-Earn-Flexible-Product-List)
     """
+    at = expires(self._resolve_timeout(timeout))
     current = 1
     while True:
-      r = await self.list(asset=asset, current=current, size=size, recv_window=recv_window, validate=validate)
+      try:
+        with deadline(at=at):
+          r = await self.list(asset=asset, current=current, size=size, recv_window=recv_window, timeout=timeout, validate=validate)
+      except DeadlineExceeded:
+        if partial:
+          break
+        raise
       if not r['rows']:
         break
       yield r['rows']
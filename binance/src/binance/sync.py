@@ -0,0 +1,233 @@
+"""Synchronous facade over the async client, for thread-based code (WSGI workers, Celery tasks, scripts).
+
+All calls are dispatched onto a single long-lived event loop running in a background thread,
+which owns the (warm) connection pool. It's safe to share a client across threads.
+Sync methods are declared with `blocking`/`generator` from the async ones, so they share their signatures and types.
+
+```python
+from binance.sync import Binance
+
+with Binance.new() as client:
+  coins = client.wallet.capital.coins()
+  for rows in client.simple_earn.flexible.list_paged():
+    ...
+```
+"""
+from typing_extensions import Any, Awaitable, AsyncIterable, AsyncIterator, Callable, Concatenate, Coroutine, Iterator, ParamSpec, TypeVar, Generic, get_args, overload
+import asyncio
+import inspect
+import threading
+from functools import wraps
+
+from binance.core import Endpoint, AuthEndpoint, UserError, BINANCE_REST_URL, deadline
+from binance.core.timeouts import current_deadline
+import binance
+import binance.wallet.capital
+import binance.simple_earn.flexible
+import binance.simple_earn.fixed
+
+T = TypeVar('T')
+P = ParamSpec('P')
+E = TypeVar('E', bound=Endpoint)
+
+def discard(aw: Awaitable):
+  # close an awaitable that won't be run, so it doesn't warn about never being awaited
+  if (close := getattr(aw, 'close', None)) is not None:
+    close()
+
+class EventLoopThread:
+  """Event loop running forever in a daemon thread. Coroutines can be submitted from any thread."""
+
+  def __init__(self, name: str = 'binance-sync'):
+    self.loop = asyncio.new_event_loop()
+    self.lock = threading.Lock()
+    self.closing = False
+    self.thread = threading.Thread(target=self.loop.run_forever, name=name, daemon=True)
+    self.thread.start()
+
+  @property
+  def running(self) -> bool:
+    return not self.closing and self.thread.is_alive()
+
+  def run(self, coro: Awaitable[T]) -> T:
+    """Run `coro` on the loop and block until it's done. The caller's deadline scope (if any) carries over.
+
+    Raises `UserError` if the loop is stopped (or stops before `coro` is done).
+    """
+    at = current_deadline.get()
+    async def scoped():
+      with deadline(at=at):
+        return await coro
+    # submit under the lock, so `stop` sees (and cancels) every task submitted before it
+    with self.lock:
+      if not self.running:
+        discard(coro)
+        raise UserError('Client is closed')
+      future = asyncio.run_coroutine_threadsafe(scoped(), self.loop)
+    try:
+      return future.result()
+    except BaseException as e:
+      future.cancel()
+      if self.closing and isinstance(e, Exception):
+        raise UserError('Client is closed') from e
+      raise
+
+  def iterate(self, it: AsyncIterator[T]) -> Iterator[T]:
+    """Drive an async iterator from the loop, as a regular generator."""
+    try:
+      while True:
+        try:
+          item = self.run(it.__anext__())
+        except StopAsyncIteration:
+          return
+        yield item
+    finally:
+      if self.running and (aclose := getattr(it, 'aclose', None)) is not None:
+        try:
+          self.run(aclose())
+        except UserError:
+          ... # stopped meanwhile; the loop finalizes it
+
+  def stop(self, cleanup: Awaitable | None = None):
+    """Stop accepting calls, cancel the ones in flight (their callers get a `UserError`), run `cleanup` and shut the loop down."""
+    with self.lock:
+      if self.closing:
+        if cleanup is not None:
+          discard(cleanup)
+        return
+      self.closing = True
+
+    async def shutdown():
+      current = asyncio.current_task()
+      tasks = [t for t in asyncio.all_tasks() if t is not current]
+      for t in tasks:
+        t.cancel()
+      await asyncio.gather(*tasks, return_exceptions=True)
+      if cleanup is not None:
+        await cleanup
+      await self.loop.shutdown_asyncgens()
+
+    try:
+      asyncio.run_coroutine_threadsafe(shutdown(), self.loop).result()
+    finally:
+      self.loop.call_soon_threadsafe(self.loop.stop)
+      self.thread.join()
+      self.loop.close()
+
+class SyncProxy(Generic[E]):
+  """Mirrors an async endpoint/router: sub-routers are proxied, coroutine methods block, async generators become generators."""
+
+  def __init__(self, endpoint: E, runner: EventLoopThread):
+    self._endpoint = endpoint
+    self._runner = runner
+    for field, cls in inspect.get_annotations(type(self)).items():
+      if isinstance(cls, type) and issubclass(cls, SyncProxy):
+        setattr(self, field, cls(getattr(endpoint, field), runner))
+
+  def __repr__(self):
+    return f'{self.__class__.__name__}({self._endpoint!r})'
+
+  def __init_subclass__(cls, **kwargs):
+    super().__init_subclass__(**kwargs)
+    # every endpoint method must be declared (with `blocking`/`generator`), so the facade can't drift from the async API
+    for base in getattr(cls, '__orig_bases__', ()):
+      for endpoint in get_args(base):
+        missing = [
+          name for name, attr in inspect.getmembers(endpoint)
+          if not name.startswith('_') and not hasattr(AuthEndpoint, name) and not hasattr(cls, name)
+          and (inspect.iscoroutinefunction(attr) or inspect.isasyncgenfunction(attr))
+        ]
+        if missing:
+          raise TypeError(f'{cls.__name__} is missing sync declarations for {endpoint.__name__}: {", ".join(missing)}')
+
+class blocking(Generic[P, T]):
+  """Declares a sync method that runs the given async endpoint method (same parameters) and blocks for its result."""
+
+  def __init__(self, method: Callable[Concatenate[Any, P], Coroutine[Any, Any, T]]):
+    self.name = method.__name__
+
+  @overload
+  def __get__(self, obj: None, objtype: type | None = None) -> 'blocking[P, T]': ...
+  @overload
+  def __get__(self, obj: SyncProxy, objtype: type | None = None) -> Callable[P, T]: ...
+  def __get__(self, obj: SyncProxy | None, objtype: type | None = None) -> 'blocking[P, T] | Callable[P, T]':
+    if obj is None:
+      return self
+    method = getattr(obj._endpoint, self.name)
+    runner = obj._runner
+    @wraps(method)
+    def run(*args: P.args, **kwargs: P.kwargs) -> T:
+      return runner.run(method(*args, **kwargs))
+    obj.__dict__[self.name] = run # cache, so later lookups skip the descriptor
+    return run
+
+class generator(Generic[P, T]):
+  """Declares a sync method that iterates the given async generator endpoint method (same parameters), as a regular generator."""
+
+  def __init__(self, method: Callable[Concatenate[Any, P], AsyncIterable[T]]):
+    self.name = method.__name__
+
+  @overload
+  def __get__(self, obj: None, objtype: type | None = None) -> 'generator[P, T]': ...
+  @overload
+  def __get__(self, obj: SyncProxy, objtype: type | None = None) -> Callable[P, Iterator[T]]: ...
+  def __get__(self, obj: SyncProxy | None, objtype: type | None = None) -> 'generator[P, T] | Callable[P, Iterator[T]]':
+    if obj is None:
+      return self
+    method = getattr(obj._endpoint, self.name)
+    runner = obj._runner
+    @wraps(method)
+    def iterate(*args: P.args, **kwargs: P.kwargs) -> Iterator[T]:
+      return runner.iterate(aiter(method(*args, **kwargs)))
+    obj.__dict__[self.name] = iterate
+    return iterate
+
+class Capital(SyncProxy[binance.wallet.capital.Capital]):
+  coins = blocking(binance.wallet.capital.Capital.coins)
+
+class Wallet(SyncProxy[binance.wallet.Wallet]):
+  capital: Capital
+
+class Flexible(SyncProxy[binance.simple_earn.flexible.Flexible]):
+  list = blocking(binance.simple_earn.flexible.Flexible.list)
+  list_paged = generator(binance.simple_earn.flexible.Flexible.list_paged)
+
+class Fixed(SyncProxy[binance.simple_earn.fixed.Fixed]):
+  list = blocking(binance.simple_earn.fixed.Fixed.list)
+  list_paged = generator(binance.simple_earn.fixed.Fixed.list_paged)
+
+class SimpleEarn(SyncProxy[binance.simple_earn.SimpleEarn]):
+  flexible: Flexible
+  fixed: Fixed
+
+class Binance(SyncProxy[binance.Binance]):
+  """Synchronous `binance.Binance`. Create with `Binance.new(...)`; close with `close()` (or use as a context manager)."""
+  simple_earn: SimpleEarn
+  wallet: Wallet
+
+  @classmethod
+  def new(
+    cls, api_key: str | None = None, api_secret: str | None = None, *,
+    base_url: str = BINANCE_REST_URL, validate: bool = True, timeout: float | None = None,
+  ) -> 'Binance':
+    runner = EventLoopThread()
+    # the async client must be created on its loop (its lock/future are bound to it)
+    async def connect():
+      client = binance.Binance.new(api_key, api_secret, base_url=base_url, validate=validate, timeout=timeout)
+      return await client.__aenter__()
+    try:
+      return cls(runner.run(connect()), runner)
+    except BaseException:
+      runner.stop()
+      raise
+
+  def close(self):
+    # calls in flight are cancelled before the connection pool is closed, so none of them reopens it
+    if self._runner.running:
+      self._runner.stop(self._endpoint.__aexit__(None, None, None))
+
+  def __enter__(self):
+    return self
+
+  def __exit__(self, exc_type, exc_value, traceback):
+    self.close()
@@ -1,5 +1,6 @@
 from dataclasses import dataclass
 from .coins import Coins
+from .index import CoinIndex, NetworkRules, WithdrawRequest
 
 @dataclass
 class Capital(Coins):
@@ -100,11 +100,13 @@ class Coins(AuthEndpoint):
     self,
     *,
     recv_window: int | None = None,
+    timeout: float | None = None,
     validate: bool | None = None
   ):
     """Get information of coins (available for deposit and withdraw) for user.
 
     - `recv_window`: Request receive window (milliseconds)
+    - `timeout`: Time budget for the call (seconds); defaults to the endpoint's `default_timeout` (pass `math.inf` to disable it).
     - `validate`: Whether to validate the response against the expected schema (default: True).
 
     > [Binance API docs](https://developers.binance.com/docs/wallet/capital)
@@ -112,5 +114,6 @@ class Coins(AuthEndpoint):
     params: dict = {}
     if recv_window is not None:
       params['recvWindow'] = recv_window
-    r = await self.authed_request('GET', '/sapi/v1/capital/config/getall', params=params)
+    with self._deadline_scope(timeout):
+      r = await self.authed_request('GET', '/sapi/v1/capital/config/getall', params=params)
     return self.output(r.text, validate_response, validate=validate)
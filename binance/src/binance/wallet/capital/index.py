@@ -0,0 +1,175 @@
+from typing_extensions import Iterable, Mapping, NotRequired, Sequence
+from dataclasses import dataclass, field
+from decimal import Decimal
+import re
+
+from binance.core import TypedDict, UserError, trunc2tick
+from .coins import Coins, CapitalConfigCoin, CapitalConfigNetwork
+
+def compile_regex(pattern: str) -> re.Pattern | re.error | None:
+  """Compile a Binance-provided regex. Empty patterns mean "no constraint"; patterns Python can't compile give back the error."""
+  if not pattern:
+    return None
+  try:
+    return re.compile(pattern)
+  except re.error as e:
+    return e
+
+def decimal(x) -> Decimal:
+  # responses fetched with `validate=False` carry numbers as strings
+  return x if isinstance(x, Decimal) else Decimal(str(x))
+
+class WithdrawRequest(TypedDict):
+  coin: str
+  """Coin symbol"""
+  network: NotRequired[str]
+  """Network name (defaults to the coin's default network)"""
+  address: str
+  """Destination address"""
+  addressTag: NotRequired[str]
+  """Secondary address identifier (memo/tag)"""
+  amount: Decimal
+  """Withdraw amount"""
+
+@dataclass(frozen=True)
+class NetworkRules:
+  config: CapitalConfigNetwork
+  address_regex: re.Pattern | re.error | None
+  """Compiled `addressRegex` (or the compile error, reported on every check)"""
+  memo_regex: re.Pattern | re.error | None
+  """Compiled `memoRegex` (or the compile error, reported on checks with a memo)"""
+  withdraw_min: Decimal
+  withdraw_max: Decimal
+  withdraw_multiple: Decimal
+  withdraw_fee: Decimal
+
+  @classmethod
+  def of(cls, config: CapitalConfigNetwork) -> 'NetworkRules':
+    return cls(
+      config=config,
+      address_regex=compile_regex(config['addressRegex']),
+      memo_regex=compile_regex(config['memoRegex']),
+      withdraw_min=decimal(config['withdrawMin']),
+      withdraw_max=decimal(config['withdrawMax']),
+      withdraw_multiple=decimal(config['withdrawIntegerMultiple']),
+      withdraw_fee=decimal(config['withdrawFee']),
+    )
+
+  def check(self, req: WithdrawRequest) -> list[str]:
+    """Pre-flight check of a withdrawal against this network. Returns the list of issues (empty if valid)."""
+    issues: list[str] = []
+    if not self.config['withdrawEnable']:
+      issues.append(f'Withdrawals disabled for {self.config["coin"]} on {self.config["network"]}')
+
+    if isinstance(self.address_regex, re.error):
+      issues.append(f'Cannot check address for network {self.config["network"]}: unsupported addressRegex ({self.address_regex})')
+    elif self.address_regex is not None and not self.address_regex.fullmatch(req['address']):
+      issues.append(f'Invalid address "{req["address"]}" for network {self.config["network"]}')
+
+    memo = req.get('addressTag')
+    if memo:
+      if isinstance(self.memo_regex, re.error):
+        issues.append(f'Cannot check memo for network {self.config["network"]}: unsupported memoRegex ({self.memo_regex})')
+      elif self.memo_regex is not None and not self.memo_regex.fullmatch(memo):
+        issues.append(f'Invalid memo "{memo}" for network {self.config["network"]}')
+    elif self.config['withdrawTag']:
+      issues.append(f'Memo required for network {self.config["network"]}')
+
+    amount = decimal(req['amount'])
+    if amount < self.withdraw_min:
+      issues.append(f'Amount {amount} below minimum {self.withdraw_min}')
+    if self.withdraw_max > 0 and amount > self.withdraw_max:
+      issues.append(f'Amount {amount} above maximum {self.withdraw_max}')
+    if self.withdraw_multiple > 0 and trunc2tick(amount, self.withdraw_multiple) != amount:
+      issues.append(f'Amount {amount} is not a multiple of {self.withdraw_multiple}')
+    return issues
+
+@dataclass
+class CoinIndex:
+  """Index over the `Coins.coins` result, with O(1) `(coin, network)` lookup and precompiled validation rules."""
+  networks: dict[tuple[str, str], NetworkRules] = field(default_factory=dict)
+  defaults: dict[str, str] = field(default_factory=dict)
+  """Default network by coin"""
+
+  @classmethod
+  def of(cls, coins: Iterable[CapitalConfigCoin]) -> 'CoinIndex':
+    index = cls()
+    index.update(coins)
+    return index
+
+  @classmethod
+  async def fetch(
+    cls, endpoint: Coins, *,
+    recv_window: int | None = None,
+    timeout: float | None = None,
+    validate: bool | None = None
+  ) -> 'CoinIndex':
+    """Fetch the coins config (via `endpoint.coins`) and build an index from it.
+
+    - `recv_window`: Request receive window (milliseconds)
+    - `timeout`: Time budget for the call (seconds); defaults to the endpoint's `default_timeout` (pass `math.inf` to disable it).
+    - `validate`: Whether to validate the response against the expected schema (default: True).
+    """
+    index = cls()
+    await index.refresh(endpoint, recv_window=recv_window, timeout=timeout, validate=validate)
+    return index
+
+  async def refresh(
+    self, endpoint: Coins, *,
+    recv_window: int | None = None,
+    timeout: float | None = None,
+    validate: bool | None = None
+  ):
+    """Re-fetch the coins config (via `endpoint.coins`) and `update` the index in place. Takes the same options as `fetch`."""
+    coins = await endpoint.coins(recv_window=recv_window, timeout=timeout, validate=validate)
+    self.update(coins)
+
+  def update(self, coins: Iterable[CapitalConfigCoin]):
+    """Rebuild the index from a refreshed config. Unchanged networks keep their compiled rules."""
+    networks: dict[tuple[str, str], NetworkRules] = {}
+    defaults: dict[str, str] = {}
+    for coin in coins:
+      for net in coin['networkList']:
+        key = (net['coin'], net['network'])
+        prev = self.networks.get(key)
+        networks[key] = prev if prev is not None and prev.config == net else NetworkRules.of(net)
+        if net['isDefault']:
+          defaults[net['coin']] = net['network']
+    self.networks = networks
+    self.defaults = defaults
+
+  def get(self, coin: str, network: str | None = None) -> NetworkRules | None:
+    """Rules for `(coin, network)`, or `None` if not found. If `network` is omitted, uses the coin's default network."""
+    if network is None:
+      network = self.defaults.get(coin)
+      if network is None:
+        return None
+    return self.networks.get((coin, network))
+
+  def __getitem__(self, key: tuple[str, str]) -> NetworkRules:
+    return self.networks[key]
+
+  def __contains__(self, key: tuple[str, str]) -> bool:
+    return key in self.networks
+
+  def __len__(self) -> int:
+    return len(self.networks)
+
+  def check(self, req: WithdrawRequest) -> list[str]:
+    """Pre-flight check of a single withdrawal. Returns the list of issues (empty if valid)."""
+    rules = self.get(req['coin'], req.get('network'))
+    if rules is None:
+      return [f'Unknown coin/network: {req["coin"]}/{req.get("network", "<default>")}']
+    return rules.check(req)
+
+  def check_batch(self, reqs: Sequence[WithdrawRequest]) -> list[list[str]]:
+    """Pre-flight check of many withdrawals in one call. Returns the issues of each request, in order."""
+    return [self.check(req) for req in reqs]
+
+  def validate_batch(self, reqs: Sequence[WithdrawRequest]):
+    """Like `check_batch`, but raises a `UserError` listing all invalid requests (by position)."""
+    issues: Mapping[int, list[str]] = {
+      i: errs for i, errs in enumerate(self.check_batch(reqs)) if errs
+    }
+    if issues:
+      raise UserError(issues)